@@ -7,7 +7,11 @@ import matplotlib.animation as animation
 from IPython.display import clear_output
 import time
 from matplotlib import gridspec
-import copy
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from concurrent.futures import ProcessPoolExecutor
+import io
 
 # import autograd functionality
 import numpy as np
@@ -16,29 +20,192 @@ import math
 # make the adjustable grid
 def make_warpable_grid(horz_min,horz_max,vert_min,vert_max):
     s = np.linspace(-10,10,40)
-    s.shape = (len(s),1)
-    g = np.array([-10,-10])
-    g.shape = (1,len(g))
     e = np.linspace(-10,10,200)
-    e.shape = (len(e),1)
-    f = np.ones((200,1))
-    f.shape = (len(f),1)
-    for a in s:
-        t = a*f
-        h = np.concatenate((e,t),axis = 1)
-        i = np.concatenate((t,e),axis = 1)
-        j = np.concatenate((h,i),axis = 0)
-        g = np.concatenate((g,j),axis = 0)
-
-    grid = g[1:,:]
+    
+    # one horizontal and one vertical line of 200 points for each value in s,
+    # interleaved so that each consecutive block of 200 rows is a single line
+    g = np.empty((len(s),2,len(e),2))
+    g[:,0,:,0] = e
+    g[:,0,:,1] = s[:,None]
+    g[:,1,:,0] = s[:,None]
+    g[:,1,:,1] = e
+    
+    grid = g.reshape(-1,2)
     return grid
 
+# create the 3 panel layout of the 2d transform animators, returning the center panel
+def _make_warp_axes(fig):
+    # create subplot with 3 panels, plot input function in center plot
+    gs = gridspec.GridSpec(1, 3, width_ratios=[1,3, 1]) 
+    ax1 = fig.add_subplot(gs[0]); ax1.axis('off');
+    ax3 = fig.add_subplot(gs[2]); ax3.axis('off');
+    ax = fig.add_subplot(gs[1])
+    return ax
+
+# draw the fixed parts of a warped grid frame and create the artists updated each frame -
+# the warped grid, the input points (if any), and num_arrows eigenvectors
+def _setup_warp_frame(ax,plot_type,has_pts,num_arrows,view):
+    # plot x and y axes, and clean up
+    ax.grid(True, which='both')
+    ax.axhline(y=0, color='k', linewidth=1)
+    ax.axvline(x=0, color='k', linewidth=1)
+    ax.set_xlim(view)
+    ax.set_ylim(view)
+    
+    # warped grid
+    grid_lc = LineCollection([],colors = [0.75,0.75,0.75],linewidths = 1,zorder = 0)
+    ax.add_collection(grid_lc)
+    
+    # input points
+    pts_artist = None
+    if has_pts:
+        # switch for plot type
+        if plot_type == 'continuous':
+            pts_artist, = ax.plot([],[],c = 'k',linewidth = 3)
+        elif plot_type == 'scatter':
+            pts_artist = ax.scatter([],[],c = 'k',edgecolor = 'w',s = 50,linewidth = 1)
+    
+    # eigenvectors
+    head_length = 0.4
+    arrows = []
+    for i in range(num_arrows):
+        arrows.append(ax.arrow(0, 0, 0, 0, head_width=0.25, head_length=head_length, fc='k', ec='k',linewidth=2,zorder = 3))
+    
+    return grid_lc,pts_artist,arrows
+
+# update the per-frame artists to show a new grid, points, and eigenvectors (hidden if vecs is None)
+def _update_warp_frame(grid_lc,pts_artist,arrows,plot_type,grid,pts,vecs):
+    # update warped grid - each consecutive block of 200 points is one line
+    grid_lc.set_segments(grid.reshape(80,200,2))
+    
+    # update input points
+    if pts_artist is not None:
+        # switch for plot type
+        if plot_type == 'continuous':
+            pts_artist.set_data(pts[:,0],pts[:,1])
+        elif plot_type == 'scatter':
+            pts_artist.set_offsets(pts)
+    
+    # update eigenvectors
+    for i in range(len(arrows)):
+        if vecs is None:
+            arrows[i].set_visible(False)
+        else:
+            arrows[i].set_data(dx = vecs[i][0],dy = vecs[i][1])
+            arrows[i].set_visible(True)
+    
+    # return the updated artists to render
+    artists = [grid_lc] + arrows
+    if pts_artist is not None:
+        artists.append(pts_artist)
+    return artists
+
+# grid, points, and eigenvectors to draw on frame k
+def _warp_frame_data(k,all_grids,all_pts,all_vecs):
+    pts = None
+    if all_pts is not None:
+        pts = all_pts[k]
+    
+    # eigenvectors are not drawn on the first (identity) frame
+    vecs = None
+    if all_vecs is not None and k > 0:
+        vecs = all_vecs[k]
+    return all_grids[k],pts,vecs
+
+# render a single frame of a warped grid to png bytes - this builds its own Figure
+# rather than using pyplot so that frames can be drawn in separate processes
+def _render_frame(grid,pts,vecs,plot_type,view):
+    # initialize figure
+    fig = Figure(figsize = (16,8))
+    FigureCanvasAgg(fig)
+    ax = _make_warp_axes(fig)
+    
+    # draw frame
+    num_arrows = 0
+    if vecs is not None:
+        num_arrows = len(vecs)
+    grid_lc,pts_artist,arrows = _setup_warp_frame(ax,plot_type,pts is not None,num_arrows,view)
+    _update_warp_frame(grid_lc,pts_artist,arrows,plot_type,grid,pts,vecs)
+    
+    # save frame
+    buf = io.BytesIO()
+    fig.savefig(buf,format = 'png')
+    return buf.getvalue()
+
+# render frames in parallel and stream them into a video file - requires imageio (with ffmpeg)
+def _render_animation_parallel(frame_args,savepath,fps):
+    import imageio.v2
+    import imageio.v3
+    
+    print ('starting animation rendering...')
+    num_frames = len(frame_args)
+    with ProcessPoolExecutor() as executor:
+        frames = [executor.submit(_render_frame,*args) for args in frame_args]
+        with imageio.v2.get_writer(savepath,fps = fps) as writer:
+            for k,frame in enumerate(frames):
+                writer.append_data(imageio.v3.imread(frame.result()))
+                
+                # print rendering update
+                if (k+1) % 25 == 0:
+                    print ('rendering animation frame ' + str(k+1) + ' of ' + str(num_frames))
+    print ('animation rendering complete!')
+    time.sleep(1.5)
+    clear_output()
+    
+    return savepath
+
+# animate frames of a warped grid shared by both 2d transform animators - all_grids and all_pts
+# hold the (num_frames,N,2) grid and points on every frame, and all_vecs (if not None) the
+# (num_frames,2,2) scaled eigenvectors, one per row.  with parallel = True frames are instead
+# rendered to a video file at savepath, whose path is returned
+def _animate_warp(all_grids,all_pts,all_vecs,plot_type,view,parallel,savepath):
+    num_frames = len(all_grids)
+    
+    # render frames in parallel straight to a video file?
+    if parallel == True:
+        frame_args = []
+        for k in range(num_frames):
+            frame_args.append(_warp_frame_data(k,all_grids,all_pts,all_vecs) + (plot_type,view))
+        return _render_animation_parallel(frame_args,savepath,fps = 1000/num_frames)
+    
+    # initialize figure
+    fig = plt.figure(figsize = (16,8))
+    ax = _make_warp_axes(fig)
+    
+    # draw fixed parts of the frame once, keeping the artists updated each frame
+    num_arrows = 0
+    if all_vecs is not None:
+        num_arrows = len(all_vecs[0])
+    grid_lc,pts_artist,arrows = _setup_warp_frame(ax,plot_type,all_pts is not None,num_arrows,view)
+    fig.canvas.draw_idle()
+    
+    # print update
+    print ('starting animation rendering...')
+    
+    # animate
+    def animate(k):
+        # print rednering update
+        if (k+1) % 25 == 0:
+            print ('rendering animation frame ' + str(k+1) + ' of ' + str(num_frames))
+        if k == num_frames - 1:
+            print ('animation rendering complete!')
+            time.sleep(1.5)
+            clear_output()  
+        
+        # update frame with its precomputed grid, points, and eigenvectors
+        grid,pts,vecs = _warp_frame_data(k,all_grids,all_pts,all_vecs)
+        return _update_warp_frame(grid_lc,pts_artist,arrows,plot_type,grid,pts,vecs)
+        
+    anim = animation.FuncAnimation(fig, animate,frames=num_frames, interval=num_frames, blit=True)
+        
+    return(anim)     
+
 # animator for showing grid of points transformed by linear transform
 def transform2d_animator(mat1,**kwargs):  
     if len(mat1.shape) > 2 or len(np.argwhere(np.asarray(mat1.shape) > 2)) > 0:
         print ('input matrix must be 2x2')
         return 
-    orig_mat1 = copy.deepcopy(mat1)
+    orig_mat1 = mat1.copy()
                                     
     # define number of frames
     num_frames = 100
@@ -52,12 +219,12 @@ def transform2d_animator(mat1,**kwargs):
     y = 2*np.sin(s)
     y.shape = (len(s),1)
     pts = np.concatenate((x,y),axis=1)
-    orig_pts = copy.deepcopy(pts)
+    orig_pts = pts.copy()
     
     # grab points if input
     if 'pts' in kwargs:
         pts = kwargs['pts']
-        orig_pts = copy.deepcopy(pts)
+        orig_pts = np.array(pts,copy = True)
 
     # type of plot - continuous or scatter
     plot_type = 'continuous'
@@ -69,89 +236,46 @@ def transform2d_animator(mat1,**kwargs):
     if 'eigvecs_on' in kwargs:
         eigvecs_on = kwargs['eigvecs_on']
         
+    # render frames in parallel to a video file at savepath (required)?  if so the path of that
+    # file is returned instead of an animation
+    parallel = False
+    if 'parallel' in kwargs:
+        parallel = kwargs['parallel']
+    savepath = None
+    if 'savepath' in kwargs:
+        savepath = kwargs['savepath']
+    if parallel == True and savepath is None:
+        print ('savepath must be given when parallel = True')
+        return
+        
     # define convex-combo parameter - via num_frames
     alphas = np.linspace(0,1,num_frames)
 
     # define grid of points via meshgrid
     viewx = 4
     viewgap = 0.1*viewx
+    view = [-viewx - viewgap,viewx + viewgap]
     viewx2 = 10
     grid = make_warpable_grid(horz_min=-viewx2,horz_max=viewx2,vert_min=-viewx2,vert_max=viewx2)
-    orig_grid = copy.deepcopy(grid)
+    orig_grid = grid.copy()
     
-    # initialize figure
-    fig = plt.figure(figsize = (16,8))
-    artist = fig
+    # define the matrix for every frame at once - shape (num_frames,2,2)
+    mats = alphas[:,None,None]*orig_mat1 + (1 - alphas)[:,None,None]*np.eye(2)
     
-    # create subplot with 3 panels, plot input function in center plot
-    gs = gridspec.GridSpec(1, 3, width_ratios=[1,3, 1]) 
-    ax1 = plt.subplot(gs[0]); ax1.axis('off');
-    ax3 = plt.subplot(gs[2]); ax3.axis('off');
+    # transform grid and input points for every frame in a single contraction each
+    all_grids = np.einsum('kij,nj->kni',mats,orig_grid)
+    all_pts = None
+    if len(orig_pts) > 0:
+        all_pts = np.einsum('kij,nj->kni',mats,orig_pts)
+        
+    # eigendecompose every frame's matrix in one batched call, scaling each eigenvector
+    # by its eigenvalue and storing one vector per row
+    all_eigvecs = None
+    if eigvecs_on == True:
+        all_vals, all_vecs = np.linalg.eig(mats)
+        all_eigvecs = np.swapaxes(all_vecs*all_vals[:,None,:],1,2)
     
-    # plot input function
-    ax = plt.subplot(gs[1])
-
-    # animate
-    def animate(k):
-        # clear the panel
-        ax.cla()
-        
-        # print rednering update
-        if np.mod(k+1,25) == 0:
-            print ('rendering animation frame ' + str(k+1) + ' of ' + str(num_frames))
-        if k == num_frames - 1:
-            print ('animation rendering complete!')
-            time.sleep(1.5)
-            clear_output()  
-        
-        # get current lambda, define current matrix
-        alpha = alphas[k]
-        mat1 = alpha*orig_mat1 + (1 - alpha)*np.eye(2)
-
-        # compute current transformation of points and plot
-        grid = np.dot(mat1,orig_grid.T).T
-            
-        # plot warped grid
-        for i in range(80):
-            ax.plot(grid[200*i:(i+1)*200,0],grid[200*i:(i+1)*200,1],color = [0.75,0.75,0.75],linewidth = 1,zorder = 0)  
-            
-        # plot input points
-        if len(orig_pts) > 0:
-            pts = np.dot(mat1,orig_pts.T).T
-            
-            # switch for plot type
-            if plot_type == 'continuous':
-                ax.plot(pts[:,0],pts[:,1],c = 'k',linewidth = 3)
-            elif plot_type == 'scatter':
-                ax.scatter(pts[:,0],pts[:,1],c = 'k',edgecolor = 'w',s = 50,linewidth = 1)
-        
-        # plot eigenvectors?
-        if eigvecs_on == True and k > 0:
-            vals, vecs = np.linalg.eig(mat1)
-            
-            # plot first eigenvector
-            head_length = 0.4
-            vec1 = vals[0]*vecs[:,0]
-            ax.arrow(0, 0, vec1[0],vec1[1], head_width=0.25, head_length=head_length, fc='k', ec='k',linewidth=2,zorder = 3)
-
-            # plot first eigenvector
-            vec2 = vals[1]*vecs[:,1]
-            ax.arrow(0, 0, vec2[0],vec2[1], head_width=0.25, head_length=head_length, fc='k', ec='k',linewidth=2,zorder = 3)
-        
-        # plot x and y axes, and clean up
-        plt.grid(True, which='both')
-        plt.axhline(y=0, color='k', linewidth=1)
-        plt.axvline(x=0, color='k', linewidth=1)
-   
-        # return artist to render
-        ax.set_xlim([-viewx - viewgap,viewx + viewgap])
-        ax.set_ylim([-viewx - viewgap,viewx + viewgap])
-        
-        return artist,
-        
-    anim = animation.FuncAnimation(fig, animate,frames=num_frames, interval=num_frames, blit=True)
-        
-    return(anim)     
+    return _animate_warp(all_grids,all_pts,all_eigvecs,plot_type,view,parallel,savepath)
 
 # animator for showing grid of points transformed by linear transform
 def nonlinear_transform2d_animator(func,**kwargs):  
@@ -167,22 +291,29 @@ def nonlinear_transform2d_animator(func,**kwargs):
     y = 2*np.sin(s)
     y.shape = (len(s),1)
     pts = np.concatenate((x,y),axis=1)
-    orig_pts = copy.deepcopy(pts)
+    orig_pts = pts.copy()
     
     # grab points if input
     if 'pts' in kwargs:
         pts = kwargs['pts']
-        orig_pts = copy.deepcopy(pts)
+        orig_pts = np.array(pts,copy = True)
 
     # type of plot - continuous or scatter
     plot_type = 'continuous'
     if 'plot_type' in kwargs:
         plot_type = kwargs['plot_type']
         
-    # draw on eigenvectors?
-    eigvecs_on = False
-    if 'eigvecs_on' in kwargs:
-        eigvecs_on = kwargs['eigvecs_on']
+    # render frames in parallel to a video file at savepath (required)?  if so the path of that
+    # file is returned instead of an animation
+    parallel = False
+    if 'parallel' in kwargs:
+        parallel = kwargs['parallel']
+    savepath = None
+    if 'savepath' in kwargs:
+        savepath = kwargs['savepath']
+    if parallel == True and savepath is None:
+        print ('savepath must be given when parallel = True')
+        return
         
     # define convex-combo parameter - via num_frames
     alphas = np.linspace(0,1,num_frames)
@@ -190,89 +321,22 @@ def nonlinear_transform2d_animator(func,**kwargs):
     # define grid of points via meshgrid
     viewx = 4
     viewgap = 0.1*viewx
+    view = [-viewx - viewgap,viewx + viewgap]
     viewx2 = 10
     grid = make_warpable_grid(horz_min=-viewx2,horz_max=viewx2,vert_min=-viewx2,vert_max=viewx2)
-    orig_grid = copy.deepcopy(grid)
+    orig_grid = grid.copy()
     
     # evaluate both the grid and input points through function
     func_orig_grid = func(orig_grid.T).T
     func_orig_pts = func(pts.T).T
     
-    # initialize figure
-    fig = plt.figure(figsize = (16,8))
-    artist = fig
-    
-    # create subplot with 3 panels, plot input function in center plot
-    gs = gridspec.GridSpec(1, 3, width_ratios=[1,3, 1]) 
-    ax1 = plt.subplot(gs[0]); ax1.axis('off');
-    ax3 = plt.subplot(gs[2]); ax3.axis('off');
-    
-    # plot input function
-    ax = plt.subplot(gs[1])
+    # interpolate between original and transformed grid and points for every frame at once
+    all_grids = (1 - alphas)[:,None,None]*orig_grid + alphas[:,None,None]*func_orig_grid
+    all_pts = None
+    if len(orig_pts) > 0:
+        all_pts = (1 - alphas)[:,None,None]*orig_pts + alphas[:,None,None]*func_orig_pts
     
-    # print update
-    print ('starting animation rendering...')
-    
-    # animate
-    def animate(k):
-        # clear the panel
-        ax.cla()
-        
-        # print rednering update
-        if np.mod(k+1,25) == 0:
-            print ('rendering animation frame ' + str(k+1) + ' of ' + str(num_frames))
-        if k == num_frames - 1:
-            print ('animation rendering complete!')
-            time.sleep(1.5)
-            clear_output()  
-        
-        # get current lambda, define current matrix
-        alpha = alphas[k]
-
-        # compute current transformation of points and plot
-        grid = (1-alpha)*orig_grid + alpha*func_orig_grid
-            
-        # plot warped grid
-        for i in range(80):
-            ax.plot(grid[200*i:(i+1)*200,0],grid[200*i:(i+1)*200,1],color = [0.75,0.75,0.75],linewidth = 1,zorder = 0)  
-            
-        # plot input points
-        if len(orig_pts) > 0:
-            pts = (1-alpha)*orig_pts + alpha*func_orig_pts
-            
-            # switch for plot type
-            if plot_type == 'continuous':
-                ax.plot(pts[:,0],pts[:,1],c = 'k',linewidth = 3)
-            elif plot_type == 'scatter':
-                ax.scatter(pts[:,0],pts[:,1],c = 'k',edgecolor = 'w',s = 50,linewidth = 1)
-        
-        # plot eigenvectors?
-        if eigvecs_on == True and k > 0:
-            vals, vecs = np.linalg.eig(mat1)
-            
-            # plot first eigenvector
-            head_length = 0.4
-            vec1 = vals[0]*vecs[:,0]
-            ax.arrow(0, 0, vec1[0],vec1[1], head_width=0.25, head_length=head_length, fc='k', ec='k',linewidth=2,zorder = 3)
-
-            # plot first eigenvector
-            vec2 = vals[1]*vecs[:,1]
-            ax.arrow(0, 0, vec2[0],vec2[1], head_width=0.25, head_length=head_length, fc='k', ec='k',linewidth=2,zorder = 3)
-        
-        # plot x and y axes, and clean up
-        plt.grid(True, which='both')
-        plt.axhline(y=0, color='k', linewidth=1)
-        plt.axvline(x=0, color='k', linewidth=1)
-   
-        # return artist to render
-        ax.set_xlim([-viewx - viewgap,viewx + viewgap])
-        ax.set_ylim([-viewx - viewgap,viewx + viewgap])
-        
-        return artist,
-        
-    anim = animation.FuncAnimation(fig, animate,frames=num_frames, interval=num_frames, blit=True)
-        
-    return(anim)     
+    return _animate_warp(all_grids,all_pts,None,plot_type,view,parallel,savepath)
         
 # animate the method
 def inner_product_visualizer(**kwargs):
@@ -283,7 +347,6 @@ def inner_product_visualizer(**kwargs):
     
     # initialize figure
     fig = plt.figure(figsize = (16,8))
-    artist = fig
 
     # create subplot with 3 panels, plot input function in center plot
     gs = gridspec.GridSpec(1, 2, width_ratios=[1,1],wspace=0.3, hspace=0.05) 
@@ -309,62 +372,68 @@ def inner_product_visualizer(**kwargs):
     
     # create linspace for sine/cosine plots
     w = np.linspace(start,2*np.pi + start,300)
+    cos_w = np.cos(w)
+    w0 = w[0]
+    dw = (w[-1] - w[0])/(len(w) - 1)
     
     # define colors for sine / cosine
     colors = ['salmon','cornflowerblue']
     
+    ### setup left panel ###
+    # plot circle with lines in left panel
+    ax1.plot(s,t,color = 'k',linewidth = 3)
+    
+    # plot moving arrow - updated each frame
+    moving_arrow = ax1.arrow(0, 0, x[0], y[0], head_width=0.1, head_length=0.1, fc='k', color = colors[1],linewidth=3,zorder = 3)
+    
+    # plot fixed arrow
+    ax1.arrow(0, 0, 0.87, 0, head_width=0.1, head_length=0.1, fc='k', color = 'k',linewidth=3,zorder = 3)
+
+    # clean up panel
+    ax1.grid(True, which='both')
+    ax1.axhline(y=0, color='k')
+    ax1.axvline(x=0, color='k')
+    
+    ### setup right panel ###
+    # sine wave so far - updated each frame
+    cos_line, = ax2.plot([],[],color = colors[1],linewidth=4,zorder = 3)
+    
+    # cleanup plot
+    ax2.grid(True, which='both')
+    ax2.axhline(y=0, color='k')
+    ax2.axvline(x=0, color='k')   
+    ax2.set_xlim([-0.3 + start,2*np.pi + 0.3 + start])
+    ax2.set_ylim([-1.2,1.2])
+    
+    # add legend
+    ax2.legend([r'cos$(\theta)$'],loc='center left', bbox_to_anchor=(0.33, 1.05),fontsize=18,ncol=2)
+    fig.canvas.draw_idle()
+    
     # print update
     print ('starting animation rendering...')
     
     # animation sub-function
     def animate(k):
-        # clear panels for next slide
-        ax1.cla()
-        ax2.cla()
-        
         # print rendering update
-        if np.mod(k+1,25) == 0:
+        if (k+1) % 25 == 0:
             print ('rendering animation frame ' + str(k+1) + ' of ' + str(num_frames))
         if k == num_frames - 1:
             print ('animation rendering complete!')
             time.sleep(1.5)
             clear_output()
         
-        ### setup left panel ###
-        # plot circle with lines in left panel
-        ax1.plot(s,t,color = 'k',linewidth = 3)
+        # update moving arrow
+        moving_arrow.set_data(dx = x[k],dy = y[k])
         
-        # plot moving arrow
-        ax1.arrow(0, 0, x[k], y[k], head_width=0.1, head_length=0.1, fc='k', color = colors[1],linewidth=3,zorder = 3)
-        
-        # plot fixed arrow
-        ax1.arrow(0, 0, 0.87, 0, head_width=0.1, head_length=0.1, fc='k', color = 'k',linewidth=3,zorder = 3)
-
-        # clean up panel
-        ax1.grid(True, which='both')
-        ax1.axhline(y=0, color='k')
-        ax1.axvline(x=0, color='k')
-        
-        ### setup right panel ###
-        # determine closest value in space of sine/cosine input
+        # determine closest value in space of sine/cosine input - w is evenly spaced
         current_angle = v[k]
-        ind = np.argmin(np.abs(w - current_angle))
-        p = w[:ind+1]
-        
-        # plot sine wave so far
-        ax2.plot(p,np.cos(p),color = colors[1],linewidth=4,zorder = 3)
-        
-        # cleanup plot
-        ax2.grid(True, which='both')
-        ax2.axhline(y=0, color='k')
-        ax2.axvline(x=0, color='k')   
-        ax2.set_xlim([-0.3 + start,2*np.pi + 0.3 + start])
-        ax2.set_ylim([-1.2,1.2])
+        ind = int(round((current_angle - w0)/dw))
         
-        # add legend
-        ax2.legend([r'cos$(\theta)$'],loc='center left', bbox_to_anchor=(0.33, 1.05),fontsize=18,ncol=2)
+        # update sine wave so far
+        cos_line.set_data(w[:ind+1],cos_w[:ind+1])
 
-        return artist,
+        # return the updated artists to render
+        return moving_arrow, cos_line
 
     anim = animation.FuncAnimation(fig, animate ,frames=num_frames, interval=num_frames, blit=True)
 
@@ -435,7 +504,7 @@ class quadratic_3d_flexer:
         def animate(k):
             ax.cla()
             # print rendering update
-            if np.mod(k+1,25) == 0:
+            if (k+1) % 25 == 0:
                 print ('rendering animation frame ' + str(k+1) + ' of ' + str(num_frames))
             if k == num_frames - 1:
                 print ('animation rendering complete!')
@@ -561,7 +630,7 @@ class quadratic_3d_rotater:
         def animate(k):
             ax.cla()
             # print rendering update
-            if np.mod(k+1,25) == 0:
+            if (k+1) % 25 == 0:
                 print ('rendering animation frame ' + str(k+1) + ' of ' + str(num_frames))
             if k == num_frames - 1:
                 print ('animation rendering complete!')
@@ -10,6 +10,114 @@ import time
 import copy
 from autograd.util import flatten_func
 
+# plain numpy for use inside numba-compiled kernels
+import numpy as onp
+
+# numba is optional - without it the kernels below run as ordinary python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args,**kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# solve a 1x1 or 2x2 linear system in closed form - plain python, since a numba kernel's
+# first-call compile would cost far more than the few short newton runs it is used in
+def _solve_small(H,g):
+    if H.shape[0] == 1:
+        if H[0,0] == 0:
+            raise onp.linalg.LinAlgError('Singular matrix')
+        return g/H[0,0]
+    det = H[0,0]*H[1,1] - H[0,1]*H[1,0]
+    if det == 0:
+        raise onp.linalg.LinAlgError('Singular matrix')
+    return onp.array([H[1,1]*g[0] - H[0,1]*g[1],-H[1,0]*g[0] + H[0,0]*g[1]])/det
+
+# wrap a jax function so that it is traced and run in float64, returning a numpy array.  jax
+# computes in float32 by default, whose rounding trips the optimizers' stopping tests - float64
+# is switched on only for the duration of each call, leaving jax's global config untouched
+def _jax_x64(f):
+    from jax.experimental import enable_x64
+    def f_x64(*args):
+        with enable_x64():
+            return onp.array(f(*args))
+    return f_x64
+
+# fastmath flags for compiled cost functions - everything except 'nnan' and 'ninf', since
+# trial steps routinely overflow a cost to inf and comparisons against it must stay defined
+_FASTMATH = {'nsz','arcp','contract','afn','reassoc'}
+
+# compile a cost function with numba - one already compiled by numba is returned as is.
+# compiling freezes the globals g reads (e.g. data arrays) and costs a pause on first use
+# (recompiling _backtrack too), so callers who want to reuse a compiled cost across runs
+# should njit it themselves and pass that in
+def _jit_cost(g):
+    if hasattr(g,'py_func'):
+        return g
+    return njit(fastmath = _FASTMATH)(g)
+
+# backtracking linesearch loop for a numba-compiled cost function g - only scalar
+# multiplies and comparisons, so no fastmath (which could hide an overflowed trial step)
+@njit
+def _backtrack(w,grad_eval,func_eval,grad_norm,g):
+    alpha = 1.0
+    t = 0.8
+    geval = g(w - alpha*grad_eval)
+    while geval > func_eval - alpha*0.5*grad_norm:
+        alpha = t*alpha
+        geval = g(w - alpha*grad_eval)
+    return alpha, geval
+
+# whole gradient descent loop for a numba-compiled cost function g, using central finite-difference
+# gradients with step h.  w_flat holds the flattened float weights, shape the shape g expects them in,
+# and steplength_rule is 0 (fixed alpha), 1 (backtracking), or 2 (diminishing).  stops early once the
+# gradient norm falls below tol, or it vanishes entirely
+@njit
+def _gd_loop(g,w_flat,shape,alpha,max_its,normalized,steplength_rule,tol,h):
+    w_flat = w_flat.copy()
+    d = w_flat.size
+    
+    # create container for weight history - one flattened weight vector per row
+    w_hist = onp.empty((max_its + 1,d))
+    w_hist[0] = w_flat
+    
+    func_eval = g(w_flat.reshape(shape))
+    grad_eval = onp.empty(d)
+    num_its = max_its
+    for k in range(max_its):
+        # finite-difference gradient
+        for i in range(d):
+            w_step = w_flat.copy()
+            w_step[i] += h
+            g_plus = g(w_step.reshape(shape))
+            w_step[i] -= 2*h
+            g_minus = g(w_step.reshape(shape))
+            grad_eval[i] = (g_plus - g_minus)/(2*h)
+        grad_norm = onp.sqrt(onp.sum(grad_eval**2))
+        
+        # stop early once the gradient has (nearly) vanished
+        if grad_norm < tol or grad_norm == 0:
+            num_its = k
+            break
+            
+        # normalized or unnormalized descent direction
+        direction = grad_eval
+        if normalized:
+            direction = grad_eval/grad_norm
+        
+        # decide on steplength parameter
+        a = alpha
+        if steplength_rule == 1:
+            a, func_eval = _backtrack(w_flat.reshape(shape),direction.reshape(shape),func_eval,onp.sum(direction**2),g)
+        elif steplength_rule == 2:
+            a = 1/(k + 1.0)
+        
+        # take gradient descent step and record
+        w_flat = w_flat - a*direction
+        w_hist[k+1] = w_flat
+    return w_hist[:num_its+1]
+
 class MyOptimizers:
     '''
     A list of current optimizers.  In each case - since these are used for educational purposes - the weights at each step are recorded and returned.
@@ -17,9 +125,23 @@ class MyOptimizers:
 
     ### gradient descent ###
     def gradient_descent(self,g,w,**kwargs):                
+        # differentiate with autograd, or compile the gradient with jax (g must then be written with jax.numpy)
+        backend = 'autograd'
+        if 'backend' in kwargs:
+            backend = kwargs['backend']
+        
         # create gradient function
         self.g = g
-        self.grad = compute_grad(self.g)
+        if backend == 'jax':
+            # g and its gradient are both run in float64
+            import jax
+            self.grad = _jax_x64(jax.jit(jax.grad(g)))
+            self.g = _jax_x64(g)
+        else:
+            self.grad = compute_grad(self.g)
+        
+        # work on plain float64 numpy weights, whatever array type was passed in
+        w = onp.asarray(w,dtype = float)
         
         # parse optional arguments        
         max_its = 100
@@ -37,21 +159,58 @@ class MyOptimizers:
         projection = 'None'
         if 'projection' in kwargs:
             projection = kwargs['projection']
+        # stop once the gradient norm falls below tol - with tol = 0 every step is taken, a
+        # vanished gradient being nudged away from zero in the normalized version instead
+        tol = 10**-8
+        if 'tol' in kwargs:
+            tol = kwargs['tol']
+            
+        # plain numpy version of g - if given, it is compiled with numba and used by backtracking line search.
+        # a plain function is recompiled on every call (taking a fresh copy of any global data it reads);
+        # pass one already wrapped with numba's njit to reuse its compiled code across calls.  it must compute
+        # exactly the same cost as g, since the sufficient decrease test compares its values against g(w)
+        self._g_jit = None
+        if 'numba_g' in kwargs:
+            self._g_jit = _jit_cost(kwargs['numba_g'])
+            
+        # run the whole loop compiled with numba?  this needs numba_g, whose finite-difference gradient
+        # replaces self.grad.  projection is not supported - with it the ordinary loop below is used
+        if 'jit_loop' in kwargs and kwargs['jit_loop'] == True and self._g_jit is not None and 'projection' not in kwargs:
+            print ('starting optimization...')
+            rule = {'backtracking':1,'diminishing':2}.get(steplength_rule,0)
+            w_hist = _gd_loop(self._g_jit,onp.ravel(w),np.shape(w),float(alpha),max_its,version == 'normalized',rule,tol,10**-6)
+            print ('...optimization complete!')
+            time.sleep(1.5)
+            clear_output()
+            
+            # return each step's weights in the shape of w, as below
+            return w_hist.reshape((len(w_hist),) + np.shape(w))
        
-        # create container for weight history 
-        w_hist = []
-        w_hist.append(w)
+        # create container for weight history - one entry per step, each the shape of w
+        w_hist = onp.empty((max_its + 1,) + np.shape(w))
+        w_hist[0] = w
+        
+        # function value at current weights - only needed by backtracking line search
+        if steplength_rule == 'backtracking':
+            func_eval = self.g(w)
         
         # start gradient descent loop
         print ('starting optimization...')
+        num_its = max_its
         for k in range(max_its):   
             # plug in value into func and derivative
             grad_eval = self.grad(w)
             grad_eval.shape = np.shape(w)
+            grad_norm = np.linalg.norm(grad_eval)
+            
+            # stop early once the gradient has (nearly) vanished
+            if grad_norm < tol:
+                num_its = k
+                break
             
             ### normalized or unnormalized descent step? ###
             if version == 'normalized':
-                grad_norm = np.linalg.norm(grad_eval)
+                # only reachable with tol = 0
                 if grad_norm == 0:
                     grad_norm += 10**-6*np.sign(2*np.random.rand(1) - 1)
                 grad_eval /= grad_norm
@@ -62,7 +221,7 @@ class MyOptimizers:
             
             # use backtracking line search?
             if steplength_rule == 'backtracking':
-                alpha = self.backtracking(w,grad_eval)
+                alpha = self.backtracking(w,grad_eval,func_eval)
                 
             # use a pre-set diminishing steplength parameter?
             if steplength_rule == 'diminishing':
@@ -74,41 +233,87 @@ class MyOptimizers:
             ### projection? ###
             if 'projection' in kwargs:
                 w = projection(w)
+                
+            # backtracking already evaluated g at the new weights - unless projection moved them
+            if steplength_rule == 'backtracking':
+                if 'projection' in kwargs:
+                    func_eval = self.g(w)
+                else:
+                    func_eval = self._last_geval
             
             # record
-            w_hist.append(w)     
+            w_hist[k+1] = w
             
         print ('...optimization complete!')
         time.sleep(1.5)
         clear_output()
         
-        return w_hist
+        return w_hist[:num_its+1]
 
-    # backtracking linesearch module
-    def backtracking(self,w,grad_eval):
+    # backtracking linesearch module - func_eval is g(w), if already known
+    def backtracking(self,w,grad_eval,func_eval = None):
         # set input parameters
         alpha = 1
         t = 0.8
         
         # compute initial function and gradient values
-        func_eval = self.g(w)
+        if func_eval is None:
+            func_eval = self.g(w)
         grad_norm = np.linalg.norm(grad_eval)**2
         
-        # loop over and tune steplength
-        while self.g(w - alpha*grad_eval) > func_eval - alpha*0.5*grad_norm:
+        # run the whole loop compiled?
+        if getattr(self,'_g_jit',None) is not None:
+            alpha, self._last_geval = _backtrack(w,grad_eval,func_eval,grad_norm,self._g_jit)
+            return alpha
+        
+        # loop over and tune steplength, keeping the function value at the accepted step
+        self._last_geval = self.g(w - alpha*grad_eval)
+        while self._last_geval > func_eval - alpha*0.5*grad_norm:
             alpha = t*alpha
+            self._last_geval = self.g(w - alpha*grad_eval)
         return alpha
             
     #### newton's method ####            
     def newtons_method(self,g,w,**kwargs):        
+        # differentiate with autograd, or compile the gradient and hessian with jax (g must then be written with jax.numpy)
+        backend = 'autograd'
+        if 'backend' in kwargs:
+            backend = kwargs['backend']
+        
         # create gradient and hessian functions
         self.g = g
         
+        # a single weight array is recorded in a preallocated history - nested lists/tuples/dicts
+        # of (possibly differently shaped) arrays are recorded in a list instead
+        w_is_array = not isinstance(w,(list,tuple,dict))
+        if w_is_array:
+            w_shape = np.shape(w)
+        
         # flatten gradient for simpler-written descent loop
-        flat_g, unflatten, w = flatten_func(self.g, w)
+        if backend == 'jax':
+            # weights are flattened, unflattened and differentiated in float64
+            import jax
+            from jax.experimental import enable_x64
+            from jax.flatten_util import ravel_pytree
+            with enable_x64():
+                w = jax.tree_util.tree_map(lambda a: onp.asarray(a,dtype = float),w)
+                w, unravel = ravel_pytree(w)
+            w = onp.asarray(w,dtype = float)
+            jax_flat_g = lambda w: self.g(unravel(w))
+            flat_g = _jax_x64(jax_flat_g)
+            
+            # unflatten weights for the history as numpy arrays, as with autograd
+            def unflatten(w):
+                with enable_x64():
+                    return jax.tree_util.tree_map(onp.asarray,unravel(w))
+            
+            self.grad = _jax_x64(jax.jit(jax.grad(jax_flat_g)))
+            self.hess = _jax_x64(jax.jit(jax.hessian(jax_flat_g)))
+        else:
+            flat_g, unflatten, w = flatten_func(self.g, w)
         
-        self.grad = compute_grad(flat_g)
-        self.hess = compute_hess(flat_g)  
+            self.grad = compute_grad(flat_g)
+            self.hess = compute_hess(flat_g)  
         
         # parse optional arguments        
         max_its = 20
@@ -118,21 +323,33 @@ class MyOptimizers:
         if 'epsilon' in kwargs:
             self.epsilon = kwargs['epsilon']
         
-        # create container for weight history 
-        w_hist = []
-        w_hist.append(unflatten(w))
+        # create container for weight history - one entry per step, each in the form of the input w
+        if w_is_array:
+            w_hist = onp.empty((max_its + 1,) + w_shape)
+            w_hist[0] = unflatten(w)
+        else:
+            w_hist = [unflatten(w)]
         
         # start newton's method loop    
         print ('starting optimization...')
         geval_old = flat_g(w)
+        I_eps = self.epsilon*np.eye(np.size(w))
         for k in range(max_its):
             # compute gradient and hessian
             grad_val = self.grad(w)
             hess_val = self.hess(w)
             hess_val.shape = (np.size(w),np.size(w))
 
-            # solve linear system for weights
-            w = w - np.dot(np.linalg.pinv(hess_val + self.epsilon*np.eye(np.size(w))),grad_val)
+            # solve linear system for weights - in closed form for tiny systems,
+            # falling back to pseudo-inverse if still singular
+            A = hess_val + I_eps
+            try:
+                if np.size(w) <= 2:
+                    w = w - _solve_small(A,grad_val)
+                else:
+                    w = w - np.linalg.solve(A,grad_val)
+            except onp.linalg.LinAlgError:
+                w = w - np.dot(np.linalg.pinv(A),grad_val)
                     
             # eject from process if reaching singular system
             geval_new = flat_g(w)
@@ -140,12 +357,15 @@ class MyOptimizers:
                 print ('singular system reached')
                 time.sleep(1.5)
                 clear_output()
-                return w_hist
+                return w_hist[:k+1]
             else:
                 geval_old = geval_new
                 
             # record current weights
-            w_hist.append(unflatten(w))
+            if w_is_array:
+                w_hist[k+1] = unflatten(w)
+            else:
+                w_hist.append(unflatten(w))
             
         print ('...optimization complete!')
         time.sleep(1.5)